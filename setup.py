@@ -20,6 +20,7 @@ setup(
     extras_require={
         "dev": [
             "pytest~=3.6.2",
+            "pytest-xdist~=1.22.2",
             "ipython",
             "thrift",
             "setuptools",
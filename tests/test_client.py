@@ -1,462 +1,505 @@
-import unittest
-from unittest.mock import MagicMock
-from uuid import uuid4
+import itertools
+from collections import deque
+
+import pytest
 
 from flipper import Condition, FeatureFlagClient, MemoryFeatureFlagStore
 from flipper.bucketing import Percentage, PercentageBucketer
 from flipper.contrib.storage import FeatureFlagStoreMeta
 from flipper.flag import FeatureFlag, FlagDoesNotExistError
 
+_seq = itertools.count()
+_CLIENT_DATA = {"k": "v"}
+_COND_FOO_TRUE = Condition(foo=True)
+_BUCKETER_10 = PercentageBucketer(percentage=Percentage(0.1))
+_NOW = 1704067200
+
+
+class _FakeBucketer:
+    def __init__(self, ret):
+        self.ret = ret
+        self.last = None
+
+    def check(self, **checks):
+        self.last = checks
+        return self.ret
+
+    @staticmethod
+    def get_type():
+        return "FakeBucketer"
+
+    def to_dict(self):
+        return {"type": self.get_type()}
+
+
+class _CallRecorder:
+    def __init__(self, return_value=None, wraps=None):
+        self.return_value = return_value
+        self.wraps = wraps
+        self.calls = []
+
+    def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        if self.wraps is not None:
+            return self.wraps(*args, **kwargs)
+        return self.return_value
+
+
+def txt():
+    return f"f{next(_seq)}"
+
+
+@pytest.fixture(scope="module")
+def store():
+    return MemoryFeatureFlagStore()
+
+
+@pytest.fixture(scope="module")
+def client(store):
+    return FeatureFlagClient(store)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    monkeypatch.setattr("flipper.contrib.memory.now", lambda: _NOW)
+    return _NOW
+
+
+@pytest.fixture(autouse=True)
+def _reset(store):
+    yield
+    store._memory.clear()
+
+
+# is_enabled
+
+
+def test_is_enabled_returns_true_when_feature_enabled(client):
+    feature_name = txt()
+
+    client.create(feature_name)
+    client.enable(feature_name)
+
+    assert client.is_enabled(feature_name) is True
+
+
+def test_is_enabled_returns_false_when_feature_disabled(client):
+    feature_name = txt()
+
+    client.create(feature_name)
+    client.disable(feature_name)
+
+    assert client.is_enabled(feature_name) is False
+
+
+def test_is_enabled_returns_false_when_feature_does_not_exist(client):
+    feature_name = txt()
+
+    assert client.is_enabled(feature_name) is False
+
+
+def test_is_enabled_returns_true_if_condition_specifies(client):
+    feature_name = txt()
+
+    client.create(feature_name, is_enabled=True)
+    client.add_condition(feature_name, _COND_FOO_TRUE)
+
+    assert client.is_enabled(feature_name, foo=True) is True
+
+
+def test_is_enabled_returns_false_if_condition_specifies(client):
+    feature_name = txt()
+
+    client.create(feature_name, is_enabled=True)
+    client.add_condition(feature_name, _COND_FOO_TRUE)
 
-class BaseTest(unittest.TestCase):
-    def setUp(self):
-        self.store = MemoryFeatureFlagStore()
-        self.client = FeatureFlagClient(self.store)
+    assert client.is_enabled(feature_name, foo=False) is False
 
-    def txt(self):
-        return uuid4().hex
 
+def test_is_enabled_returns_false_if_feature_disabled_despite_condition(client):
+    feature_name = txt()
 
-class TestIsEnabled(BaseTest):
-    def test_returns_true_when_feature_enabled(self):
-        feature_name = self.txt()
+    client.create(feature_name, is_enabled=False)
+    client.add_condition(feature_name, _COND_FOO_TRUE)
 
-        self.client.create(feature_name)
-        self.client.enable(feature_name)
+    assert client.is_enabled(feature_name, foo=True) is False
 
-        self.assertTrue(self.client.is_enabled(feature_name))
 
-    def test_returns_false_when_feature_disabled(self):
-        feature_name = self.txt()
+def test_is_enabled_returns_false_if_bucketer_check_returns_false(client):
+    feature_name = txt()
 
-        self.client.create(feature_name)
-        self.client.disable(feature_name)
+    bucketer = _FakeBucketer(False)
 
-        self.assertFalse(self.client.is_enabled(feature_name))
+    client.create(feature_name, is_enabled=True)
+    client.set_bucketer(feature_name, bucketer)
 
-    def test_returns_false_when_feature_does_not_exist(self):
-        feature_name = self.txt()
+    assert client.is_enabled(feature_name) is False
 
-        self.assertFalse(self.client.is_enabled(feature_name))
 
-    def test_returns_true_if_condition_specifies(self):
-        feature_name = self.txt()
+def test_is_enabled_returns_true_if_bucketer_check_returns_true(client):
+    feature_name = txt()
 
-        self.client.create(feature_name, is_enabled=True)
-        self.client.add_condition(feature_name, Condition(foo=True))
+    bucketer = _FakeBucketer(True)
 
-        self.assertTrue(self.client.is_enabled(feature_name, foo=True))
+    client.create(feature_name, is_enabled=True)
+    client.set_bucketer(feature_name, bucketer)
 
-    def test_returns_false_if_condition_specifies(self):
-        feature_name = self.txt()
+    assert client.is_enabled(feature_name) is True
 
-        self.client.create(feature_name, is_enabled=True)
-        self.client.add_condition(feature_name, Condition(foo=True))
 
-        self.assertFalse(self.client.is_enabled(feature_name, foo=False))
+def test_is_enabled_forwards_conditions_to_bucketer(client):
+    feature_name = txt()
 
-    def test_returns_false_if_feature_disabled_despite_condition(self):
-        feature_name = self.txt()
+    bucketer = _FakeBucketer(True)
 
-        self.client.create(feature_name, is_enabled=False)
-        self.client.add_condition(feature_name, Condition(foo=True))
+    client.create(feature_name, is_enabled=True)
+    client.set_bucketer(feature_name, bucketer)
 
-        self.assertFalse(self.client.is_enabled(feature_name, foo=True))
+    client.is_enabled(feature_name, foo=True)
 
-    def test_returns_false_if_bucketer_check_returns_false(self):
-        feature_name = self.txt()
+    assert {"foo": True} == bucketer.last
 
-        bucketer = MagicMock()
-        bucketer.check.return_value = False
 
-        self.client.create(feature_name, is_enabled=True)
-        self.client.set_bucketer(feature_name, bucketer)
+# create
 
-        self.assertFalse(self.client.is_enabled(feature_name))
 
-    def test_returns_true_if_bucketer_check_returns_true(self):
-        feature_name = self.txt()
+def test_create_returns_instance_of_feature_flag_class(client):
+    feature_name = txt()
 
-        bucketer = MagicMock()
-        bucketer.check.return_value = True
+    flag = client.create(feature_name)
 
-        self.client.create(feature_name, is_enabled=True)
-        self.client.set_bucketer(feature_name, bucketer)
+    assert isinstance(flag, FeatureFlag)
 
-        self.assertTrue(self.client.is_enabled(feature_name))
 
-    def test_forwards_conditions_to_bucketer(self):
-        feature_name = self.txt()
+def test_create_creates_flag_with_correct_name(client):
+    feature_name = txt()
 
-        bucketer = MagicMock()
+    flag = client.create(feature_name)
 
-        self.client.create(feature_name, is_enabled=True)
-        self.client.set_bucketer(feature_name, bucketer)
+    assert feature_name == flag.name
 
-        self.client.is_enabled(feature_name, foo=True)
 
-        bucketer.check.assert_called_with(foo=True)
+def test_create_is_enabled_defaults_to_false(client):
+    feature_name = txt()
 
+    client.create(feature_name)
 
-class TestCreate(BaseTest):
-    def test_creates_and_returns_instance_of_feature_flag_class(self):
-        feature_name = self.txt()
+    assert client.is_enabled(feature_name) is False
 
-        flag = self.client.create(feature_name)
 
-        self.assertTrue(isinstance(flag, FeatureFlag))
+def test_create_flag_can_be_enabled_on_create(client):
+    feature_name = txt()
 
-    def test_creates_flag_with_correct_name(self):
-        feature_name = self.txt()
+    client.create(feature_name, is_enabled=True)
 
-        flag = self.client.create(feature_name)
+    assert client.is_enabled(feature_name) is True
 
-        self.assertEqual(feature_name, flag.name)
 
-    def test_is_enabled_defaults_to_false(self):
-        feature_name = self.txt()
+# get
 
-        self.client.create(feature_name)
 
-        self.assertFalse(self.client.is_enabled(feature_name))
+def test_get_returns_instance_of_feature_flag_class(client):
+    feature_name = txt()
 
-    def test_flag_can_be_enabled_on_create(self):
-        feature_name = self.txt()
+    client.create(feature_name)
 
-        self.client.create(feature_name, is_enabled=True)
+    flag = client.get(feature_name)
 
-        self.assertTrue(self.client.is_enabled(feature_name))
+    assert isinstance(flag, FeatureFlag)
 
 
-class TestGet(BaseTest):
-    def test_returns_instance_of_feature_flag_class(self):
-        feature_name = self.txt()
+def test_get_returns_flag_with_correct_name(client):
+    feature_name = txt()
 
-        self.client.create(feature_name)
+    client.create(feature_name)
 
-        flag = self.client.get(feature_name)
+    flag = client.get(feature_name)
 
-        self.assertTrue(isinstance(flag, FeatureFlag))
+    assert feature_name == flag.name
 
-    def test_returns_flag_with_correct_name(self):
-        feature_name = self.txt()
 
-        self.client.create(feature_name)
+# destroy
 
-        flag = self.client.get(feature_name)
 
-        self.assertEqual(feature_name, flag.name)
+def test_destroy_get_will_return_instance_of_flag(client):
+    feature_name = txt()
 
+    client.create(feature_name)
+    client.destroy(feature_name)
 
-class TestDestroy(BaseTest):
-    def test_get_will_return_instance_of_flag(self):
-        feature_name = self.txt()
+    flag = client.get(feature_name)
 
-        self.client.create(feature_name)
-        self.client.destroy(feature_name)
+    assert isinstance(flag, FeatureFlag)
 
-        flag = self.client.get(feature_name)
 
-        self.assertTrue(isinstance(flag, FeatureFlag))
+def test_destroy_status_switches_to_disabled(client):
+    feature_name = txt()
 
-    def test_status_switches_to_disabled(self):
-        feature_name = self.txt()
+    client.create(feature_name)
+    client.enable(feature_name)
+    client.destroy(feature_name)
 
-        self.client.create(feature_name)
-        self.client.enable(feature_name)
-        self.client.destroy(feature_name)
+    assert client.is_enabled(feature_name) is False
 
-        self.assertFalse(self.client.is_enabled(feature_name))
 
-    def test_raises_for_nonexistent_flag(self):
-        feature_name = self.txt()
+# enable
 
-        with self.assertRaises(FlagDoesNotExistError):
-            self.client.destroy(feature_name)
 
+def test_enable_is_enabled_will_be_true(client):
+    feature_name = txt()
 
-class TestEnable(BaseTest):
-    def test_is_enabled_will_be_true(self):
-        feature_name = self.txt()
+    client.create(feature_name)
+    client.enable(feature_name)
 
-        self.client.create(feature_name)
-        self.client.enable(feature_name)
+    assert client.is_enabled(feature_name) is True
 
-        self.assertTrue(self.client.is_enabled(feature_name))
 
-    def test_is_enabled_will_be_true_if_disable_was_called_earlier(self):
-        feature_name = self.txt()
+def test_enable_is_enabled_will_be_true_if_disable_was_called_earlier(client):
+    feature_name = txt()
 
-        self.client.create(feature_name)
-        self.client.disable(feature_name)
-        self.client.enable(feature_name)
+    client.create(feature_name)
+    client.disable(feature_name)
+    client.enable(feature_name)
 
-        self.assertTrue(self.client.is_enabled(feature_name))
+    assert client.is_enabled(feature_name) is True
 
-    def test_raises_for_nonexistent_flag(self):
-        feature_name = self.txt()
 
-        with self.assertRaises(FlagDoesNotExistError):
-            self.client.enable(feature_name)
+# disable
 
 
-class TestDisable(BaseTest):
-    def test_is_enabled_will_be_false(self):
-        feature_name = self.txt()
+def test_disable_is_enabled_will_be_false(client):
+    feature_name = txt()
 
-        self.client.create(feature_name)
-        self.client.disable(feature_name)
+    client.create(feature_name)
+    client.disable(feature_name)
 
-        self.assertFalse(self.client.is_enabled(feature_name))
+    assert client.is_enabled(feature_name) is False
 
-    def test_is_enabled_will_be_false_if_enable_was_called_earlier(self):
-        feature_name = self.txt()
 
-        self.client.create(feature_name)
-        self.client.enable(feature_name)
-        self.client.disable(feature_name)
+def test_disable_is_enabled_will_be_false_if_enable_was_called_earlier(client):
+    feature_name = txt()
 
-        self.assertFalse(self.client.is_enabled(feature_name))
+    client.create(feature_name)
+    client.enable(feature_name)
+    client.disable(feature_name)
 
-    def test_raises_for_nonexistent_flag(self):
-        feature_name = self.txt()
+    assert client.is_enabled(feature_name) is False
 
-        with self.assertRaises(FlagDoesNotExistError):
-            self.client.disable(feature_name)
 
+# nonexistent flags
 
-class TestExists(BaseTest):
-    def test_exists_is_false_when_feature_does_not_exist(self):
-        feature_name = self.txt()
 
-        self.assertFalse(self.client.exists(feature_name))
+@pytest.mark.parametrize(
+    "operation",
+    [
+        lambda client, name: client.enable(name),
+        lambda client, name: client.disable(name),
+        lambda client, name: client.destroy(name),
+        lambda client, name: client.set_client_data(name, {}),
+        lambda client, name: client.get_client_data(name),
+        lambda client, name: client.get_meta(name),
+    ],
+    ids=[
+        "enable",
+        "disable",
+        "destroy",
+        "set_client_data",
+        "get_client_data",
+        "get_meta",
+    ],
+)
+def test_raises_for_nonexistent_flag(client, operation):
+    feature_name = txt()
 
-    def test_exists_is_true_when_feature_does_exist(self):
-        feature_name = self.txt()
-        self.client.create(feature_name)
+    with pytest.raises(FlagDoesNotExistError):
+        operation(client, feature_name)
 
-        self.assertTrue(self.client.exists(feature_name))
 
+# exists
 
-class TestList(BaseTest):
-    def test_calls_backend_with_correct_args(self):
-        self.store.list = MagicMock()
 
-        limit, offset = 10, 25
-        list(self.client.list(limit=limit, offset=offset))
+def test_exists_is_false_when_feature_does_not_exist(client):
+    feature_name = txt()
 
-        self.store.list.assert_called_once_with(limit=limit, offset=offset)
+    assert client.exists(feature_name) is False
 
-    def test_returns_flag_objects(self):
-        feature_name = self.txt()
 
-        self.client.create(feature_name)
+def test_exists_is_true_when_feature_does_exist(client):
+    feature_name = txt()
+    client.create(feature_name)
 
-        flag = next(self.client.list())
+    assert client.exists(feature_name) is True
 
-        self.assertIsInstance(flag, FeatureFlag)
 
-    def test_returns_correct_flag_objects(self):
-        feature_name = self.txt()
+# list
 
-        expected = self.client.create(feature_name)
 
-        actual = next(self.client.list())
+def test_list_calls_backend_with_correct_args(client, store, monkeypatch):
+    recorder = _CallRecorder(return_value=())
+    monkeypatch.setattr(store, "list", recorder)
 
-        self.assertEqual(expected.name, actual.name)
+    limit, offset = 10, 25
+    deque(client.list(limit=limit, offset=offset), maxlen=0)
 
-    def test_returns_correct_count_of_flag_objects(self):
-        feature_names = [self.txt() for _ in range(10)]
+    assert [((), {"limit": limit, "offset": offset})] == recorder.calls
 
-        for feature_name in feature_names:
-            self.client.create(feature_name)
 
-        actual = list(self.client.list())
+def test_list_returns_flag_objects(client):
+    feature_name = txt()
 
-        self.assertEqual(len(feature_names), len(actual))
+    client.create(feature_name)
 
+    flag = next(client.list())
 
-class TestSetClientData(BaseTest):
-    def test_calls_backend_with_correct_feature_name(self):
-        self.store.set_meta = MagicMock()
+    assert isinstance(flag, FeatureFlag)
 
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
 
-        self.client.create(feature_name)
-        self.client.set_client_data(feature_name, client_data)
+def test_list_returns_correct_flag_objects(client):
+    feature_name = txt()
 
-        [actual, _] = self.store.set_meta.call_args[0]
+    expected = client.create(feature_name)
 
-        self.assertEqual(feature_name, actual)
+    actual = next(client.list())
 
-    def test_calls_backend_with_instance_of_meta(self):
-        self.store.set_meta = MagicMock()
+    assert expected.name == actual.name
 
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
 
-        self.client.create(feature_name)
-        self.client.set_client_data(feature_name, client_data)
+def test_list_returns_correct_count_of_flag_objects(client):
+    feature_names = [txt() for _ in range(10)]
 
-        [_, meta] = self.store.set_meta.call_args[0]
+    for feature_name in feature_names:
+        client.create(feature_name)
 
-        self.assertIsInstance(meta, FeatureFlagStoreMeta)
+    assert len(feature_names) == sum(1 for _ in client.list())
 
-    def test_calls_backend_with_correct_meta_client_data(self):
-        self.store.set_meta = MagicMock()
 
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
+# set_client_data
 
-        self.client.create(feature_name)
-        self.client.set_client_data(feature_name, client_data)
 
-        [_, meta] = self.store.set_meta.call_args[0]
+def test_set_client_data_forwards_expected_meta(client, store, monkeypatch, frozen_now):
+    recorder = _CallRecorder(wraps=store.set_meta)
+    monkeypatch.setattr(store, "set_meta", recorder)
 
-        self.assertEqual(client_data, meta.client_data)
+    feature_name = txt()
+    client_data = _CLIENT_DATA
 
-    def test_calls_backend_with_non_null_meta_created_date(self):
-        self.store.set_meta = MagicMock()
+    client.create(feature_name)
+    client.set_client_data(feature_name, client_data)
 
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
+    assert 1 == len(recorder.calls)
 
-        self.client.create(feature_name)
-        self.client.set_client_data(feature_name, client_data)
+    [name, meta] = recorder.calls[0][0]
 
-        [_, meta] = self.store.set_meta.call_args[0]
+    assert feature_name == name
+    assert isinstance(meta, FeatureFlagStoreMeta)
+    assert client_data == meta.client_data
+    assert frozen_now == meta.created_date
+    assert client_data == client.get_client_data(feature_name)
 
-        self.assertIsNotNone(meta.created_date)
 
-    def test_calls_backend_exactly_once(self):
-        self.store.set_meta = MagicMock()
+def test_set_client_data_merges_new_values_with_existing(client, store):
+    feature_name = txt()
+    existing_data = {"existing_key": "x"}
 
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
+    store.create(feature_name, client_data=existing_data)
 
-        self.client.create(feature_name)
-        self.client.set_client_data(feature_name, client_data)
+    new_data = {"new_key": "v"}
+    client.set_client_data(feature_name, new_data)
 
-        self.assertEqual(1, self.store.set_meta.call_count)
+    item = store.get(feature_name)
 
-    def test_merges_new_values_with_existing(self):
-        feature_name = self.txt()
-        existing_data = {"existing_key": self.txt()}
+    assert {**existing_data, **new_data} == item.meta["client_data"]
 
-        self.store.create(feature_name, client_data=existing_data)
 
-        new_data = {"new_key": self.txt()}
-        self.client.set_client_data(feature_name, new_data)
+def test_set_client_data_can_override_existing_values(client, store):
+    feature_name = txt()
+    existing_data = {"existing_key": "x"}
 
-        item = self.store.get(feature_name)
+    store.create(feature_name, client_data=existing_data)
 
-        self.assertEqual({**existing_data, **new_data}, item.meta["client_data"])
+    new_data = {"existing_key": "y", "new_key": "v"}
+    client.set_client_data(feature_name, new_data)
 
-    def test_can_override_existing_values(self):
-        feature_name = self.txt()
-        existing_data = {"existing_key": self.txt()}
+    item = store.get(feature_name)
 
-        self.store.create(feature_name, client_data=existing_data)
+    assert new_data == item.meta["client_data"]
 
-        new_data = {"existing_key": self.txt(), "new_key": self.txt()}
-        self.client.set_client_data(feature_name, new_data)
 
-        item = self.store.get(feature_name)
+# get_client_data
 
-        self.assertEqual(new_data, item.meta["client_data"])
 
-    def test_raises_for_nonexistent_flag(self):
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
+def test_get_client_data_gets_expected_key_value_pairs(client):
+    feature_name = txt()
 
-        with self.assertRaises(FlagDoesNotExistError):
-            self.client.set_client_data(feature_name, client_data)
+    client.create(feature_name, client_data=dict(_CLIENT_DATA))
 
+    result = client.get_client_data(feature_name)
 
-class TestGetClientData(BaseTest):
-    def test_gets_expected_key_value_pairs(self):
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
+    assert _CLIENT_DATA == result
 
-        self.client.create(feature_name, client_data=client_data)
 
-        result = self.client.get_client_data(feature_name)
+# get_meta
 
-        self.assertEqual(client_data, result)
 
-    def test_raises_for_nonexistent_flag(self):
-        feature_name = self.txt()
+def test_get_meta_includes_created_date(client, frozen_now):
+    feature_name = txt()
 
-        with self.assertRaises(FlagDoesNotExistError):
-            self.client.get_client_data(feature_name)
+    client.create(feature_name, client_data=dict(_CLIENT_DATA))
 
+    meta = client.get_meta(feature_name)
 
-class TestGetMeta(BaseTest):
-    def test_includes_created_date(self):
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
+    assert frozen_now == meta["created_date"]
 
-        self.client.create(feature_name, client_data=client_data)
 
-        meta = self.client.get_meta(feature_name)
+def test_get_meta_includes_client_data(client):
+    feature_name = txt()
 
-        self.assertTrue("created_date" in meta)
+    client.create(feature_name, client_data=dict(_CLIENT_DATA))
 
-    def test_includes_client_data(self):
-        feature_name = self.txt()
-        client_data = {self.txt(): self.txt()}
+    meta = client.get_meta(feature_name)
 
-        self.client.create(feature_name, client_data=client_data)
+    assert _CLIENT_DATA == meta["client_data"]
 
-        meta = self.client.get_meta(feature_name)
 
-        self.assertEqual(client_data, meta["client_data"])
+# add_condition
 
-    def test_raises_for_nonexistent_flag(self):
-        feature_name = self.txt()
 
-        with self.assertRaises(FlagDoesNotExistError):
-            self.client.get_meta(feature_name)
+def test_add_condition_gets_included_in_meta(client):
+    feature_name = txt()
+    condition_checks = {txt(): True}
+    condition = Condition(**condition_checks)
 
+    client.create(feature_name)
+    client.add_condition(feature_name, condition)
 
-class TestAddCondition(BaseTest):
-    def test_condition_gets_included_in_meta(self):
-        feature_name = self.txt()
-        condition_checks = {self.txt(): True}
-        condition = Condition(**condition_checks)
+    meta = client.get_meta(feature_name)
 
-        self.client.create(feature_name)
-        self.client.add_condition(feature_name, condition)
+    assert condition.to_dict() in meta["conditions"]
 
-        meta = self.client.get_meta(feature_name)
 
-        self.assertTrue(condition.to_dict() in meta["conditions"])
+def test_add_condition_gets_appended_to_meta(client):
+    feature_name = txt()
+    condition_checks = {txt(): True}
+    condition = Condition(**condition_checks)
 
-    def test_condition_gets_appended_to_meta(self):
-        feature_name = self.txt()
-        condition_checks = {self.txt(): True}
-        condition = Condition(**condition_checks)
+    client.create(feature_name)
+    client.add_condition(feature_name, condition)
+    client.add_condition(feature_name, condition)
 
-        self.client.create(feature_name)
-        self.client.add_condition(feature_name, condition)
-        self.client.add_condition(feature_name, condition)
+    meta = client.get_meta(feature_name)
 
-        meta = self.client.get_meta(feature_name)
+    assert 2 == len(meta["conditions"])
 
-        self.assertEqual(2, len(meta["conditions"]))
 
+# set_bucketer
 
-class TestSetBucketer(BaseTest):
-    def test_bucketer_gets_included_in_meta(self):
-        feature_name = self.txt()
 
-        percentage_value = 0.1
-        bucketer = PercentageBucketer(percentage=Percentage(percentage_value))
+def test_set_bucketer_gets_included_in_meta(client):
+    feature_name = txt()
 
-        self.client.create(feature_name)
-        self.client.set_bucketer(feature_name, bucketer)
+    client.create(feature_name)
+    client.set_bucketer(feature_name, _BUCKETER_10)
 
-        meta = self.client.get_meta(feature_name)
+    meta = client.get_meta(feature_name)
 
-        self.assertEqual(bucketer.to_dict(), meta["bucketer"])
+    assert _BUCKETER_10.to_dict() == meta["bucketer"]